@@ -2,7 +2,7 @@ from setuptools import find_packages, setup
 
 setup(
     name="eight-stars",
-    version="1.0.0",
+    version="2.0.0",
     author="Robert Ganowski",
     author_email="robert.ganowski@gmail.com",
     description="Simple stars geometries",
@@ -16,6 +16,9 @@ setup(
         "": "src"
     },
     include_package_data=True,
+    install_requires=[
+        "numpy>=1.20",
+    ],
     classifiers=[
         "Programming Language :: Python :: 3.7",
         "License :: OSI Approved :: MIT License",
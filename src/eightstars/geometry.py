@@ -1,21 +1,34 @@
 from __future__ import annotations
 
-from itertools import chain
-from math import cos, pi, sin
-from typing import Optional
+from functools import lru_cache
+from math import cos, pi, tau
+from sys import float_info
+from typing import NamedTuple, Optional
 
+import numpy as np
+from numpy.typing import ArrayLike, DTypeLike
 
-class Point:
+# Relative error of coordinates, assumed to carry a few units in the last
+# place of noise from the calculations that produced them
+_ULPS = 4 * float_info.epsilon
+
+
+class Point(NamedTuple):
     """A point in cartesian coordinates.
     """
 
-    def __init__(self, x: float, y: float, decimals: int = 5) -> None:
-        """Initializes Point, recording its coordinates with a precision
+    x: float
+    y: float
+
+    @classmethod
+    def rounded(cls, x: float, y: float, decimals: int = 5) -> Point:
+        """Creates Point, recording its coordinates with a precision
         rounded to given decimal places. The exact precision of coordinates
-        is not so crucial, but leaving it as original numbers can lead
-        to anomalies related to computer representation of floating-point
-        numbers (eg. vertical straight could not be treated as such!).
-        For full explanation read either:
+        is rarely crucial, and rounded numbers are easier to read and
+        compare. Rounding is a matter of output only, though: calculations
+        of Straight and Star take the computer representation of
+        floating-point numbers into account themselves and do not need
+        rounded points. For full explanation read either:
             * https://docs.python.org/3/tutorial/floatingpoint.html
             * https://floating-point-gui.de/basic/
             * https://en.wikipedia.org/wiki/Floating-point_arithmetic
@@ -23,10 +36,12 @@ class Point:
         Args:
             x (float): x-coordinate
             y (float): y-coordinate
-            decimals (int): number of decimal places
+            decimals (int, optional): number of decimal places. Defaults to 5.
+
+        Returns:
+            Point: New point.
         """
-        self.x = round(x, decimals)
-        self.y = round(y, decimals)
+        return cls(round(x, decimals), round(y, decimals))
 
     def moved(self, x_distance: float = 0, y_distance: float = 0) -> Point:
         """Gives a new point shifted from the one in hand by  x and y distances.
@@ -52,25 +67,39 @@ class Straight:
     """Straight line based on two points.
     """
 
+    __slots__ = ("a", "b", "x", "decimals", "_scale", "_a_error", "_b_error")
+
     def __init__(self, A: Point, B: Point, decimals: int = 5) -> None:
         """Initializes Straight basing on coordinates of its two given
         points: A and B.
         Calculates slope (a) and x-intercept (b) of non-vertical straight
-        (for linear equation), when A.x != B.x or accepts constant x for
-        the opposite case. Results are rounded to given decimal places
-        - see the explanation in Point class constructor.
+        (for linear equation), or accepts constant x when A.x and B.x are
+        equal up to a few units in the last place of the largest coordinate.
+        Both are kept unrounded; instead, bounds of the floating-point errors
+        of the slope and the intercept are recorded, assuming every
+        coordinate may be off by a few units in the last place, so that
+        comparisons do not depend on prior rounding of the points. Decimal
+        places are used for the intersection points and the text form only
+        - see the explanation in Point.rounded.
 
         Args:
             A (Point): First point
             B (Point): Second point
             decimals (int): number of decimal places
         """
-        if A.x != B.x:
-            self.a = round((B.y - A.y) / (B.x - A.x), decimals)
-            self.b = round(A.y - self.a * A.x, decimals)
+        self.decimals = decimals
+        self._scale = 10.0 ** decimals
+        noise = _ULPS * max(abs(A.x), abs(A.y), abs(B.x), abs(B.y))
+        if abs(B.x - A.x) > noise:
+            self.a = (B.y - A.y) / (B.x - A.x)
+            self.b = A.y - self.a * A.x
             self.x = None
+            self._a_error = noise * (1 + abs(self.a)) / abs(B.x - A.x)
+            self._b_error = \
+                noise * (1 + abs(self.a)) + abs(A.x) * self._a_error
         else:
             self.x = A.x
+            self._b_error = noise
 
     def intersection(self, other: Straight) -> Optional[Point]:
         """Calculates the point of intersection with other straight.
@@ -86,50 +115,54 @@ class Straight:
             Optional[Point]: Point of intersection if the straights intersects
             or None if they are parallel.
         """
-        if self.x is None and other.x is None:
-            # None of the straight are vertical
-            if self.a == other.a:
-                if self.b == other.b:
-                    # Coincidental non-vertical straights
-                    raise CoincidentStraights
-                else:
+        if self.x is None:
+            if other.x is None:
+                # None of the straight are vertical
+                slopes = self.a - other.a
+                if abs(slopes) <= self._a_error + other._a_error:
+                    if abs(self.b - other.b) <= \
+                            self._b_error + other._b_error:
+                        # Coincidental non-vertical straights
+                        raise CoincidentStraights
                     # Parallel non-vertical straights
                     return None
-            else:
-                # Non-parallel, non-vertical straights
-                x = (other.b - self.b) / (self.a - other.a)
+                x = (other.b - self.b) / slopes
                 y = self.a * x + self.b
-        elif self.x is not None and other.x is not None:
-            # Both straight vertical
-            if self.x == other.x:
-                # Coincidental vertical straights
-                raise CoincidentStraights
             else:
-                # Parallel vertical straights
-                return None
-        elif self.x is not None:
+                # Only the other straight is vertical
+                x = other.x
+                y = self.a * x + self.b
+        elif other.x is None:
             # Only the first straight is vertical
             x = self.x
             y = other.a * x + other.b
         else:
-            # Only the other straight is vertical
-            x = other.x
-            y = self.a * x + self.b
+            # Both straight vertical
+            if abs(self.x - other.x) <= self._b_error + other._b_error:
+                # Coincidental vertical straights
+                raise CoincidentStraights
+            # Parallel vertical straights
+            return None
 
-        return Point(x, y)
+        # Rounded the way np.round does it, as Star coordinates are, which
+        # is several times faster than the built-in round with ndigits
+        scale = self._scale
+        return Point(round(x * scale) / scale, round(y * scale) / scale)
 
     def __str__(self) -> str:
         if self.x is not None:
             return f"x = {self.x}"
         else:
-            s = f"{self.a}x" if self.a != 0 else ""
+            a = round(self.a, self.decimals)
+            b = round(self.b, self.decimals)
+            s = f"{a}x" if a != 0 else ""
             if not s:
-                s = f"{self.b}"
+                s = f"{b}"
             else:
-                if self.b < 0:
-                    s += f" - {abs(self.b)}"
-                elif self.b > 0:
-                    s += f" + {self.b}"
+                if b < 0:
+                    s += f" - {abs(b)}"
+                elif b > 0:
+                    s += f" + {b}"
             return f"y = {s}"
 
 
@@ -137,6 +170,154 @@ class StarError(Exception):
     pass
 
 
+def _check_inputs(corners: int, first_corner_slopes: ArrayLike) -> None:
+    """Validates arguments of a star or many stars at once. A single slope
+    is checked with plain comparisons, as NumPy would only slow it down.
+
+    Args:
+        corners (int): number of corners
+        first_corner_slopes (ArrayLike): first corner slope or an array
+            of slopes
+
+    Raises:
+        ValueError: Exception raised when arguments cannot form a star.
+    """
+    if corners <= 2:
+        raise ValueError("Star should have at least 3 corners")
+    if isinstance(first_corner_slopes, np.ndarray):
+        in_range = np.all(
+            (0 <= first_corner_slopes) & (first_corner_slopes < tau))
+    else:
+        in_range = 0 <= first_corner_slopes < tau
+    if not in_range:
+        raise ValueError("First corner slope should be between 0 and 2π")
+
+
+def _inner_radius_ratio(corners: int, style: int) -> float:
+    """Calculates ratio of the distance of inner vertices to the distance
+    of corners from the center of a star formed according to `style`.
+    The straight from corner `i` to `i + style` lies at the distance of
+    r * cos(style * spacing_angle / 2) from the center, so its intersection
+    with the straight from `i + 1 - style` to `i + 1`, halfway between the
+    corners, is found in a closed form. The straights are parallel when
+    the cosine in the denominator is an analytic zero, which after floating
+    point calculations is left with a few units in the last place.
+
+    Args:
+        corners (int): number of corners
+        style (int): style of a star - see Star class constructor
+
+    Raises:
+        StarError: Exception raised when the straights do not intersect.
+
+    Returns:
+        float: inner to outer radius ratio (negative when inner vertices
+        lie on the opposite side of the center)
+    """
+    spacing_angle = tau / corners
+    if style % corners == 1:
+        raise StarError(
+            "Unable to compute inner vertices for corners and style."
+            " The straights must intersect, but are overlapping.")
+    half_angle = (style - 1) * spacing_angle / 2
+    denominator = cos(half_angle)
+    if style % corners == 0 \
+            or abs(denominator) <= _ULPS * (1 + abs(half_angle)):
+        raise StarError(
+            "Unable to compute inner vertices for corners and  style."
+            " The straights must intersect, but are parallel.")
+    return cos(style * spacing_angle / 2) / denominator
+
+
+@lru_cache(maxsize=64)
+def _unit_circle(
+    corners: int, first_corner_slope: float, dtype: np.dtype
+) -> tuple[np.ndarray, np.ndarray]:
+    """Provides sines and cosines of slopes of all star vertices, corners
+    interleaved with inner vertices. Cached, as most of stars share the
+    same few numbers of corners and slopes. The arrays are read-only.
+
+    Args:
+        corners (int): number of corners
+        first_corner_slope (float): first corner slope in radians
+        dtype (np.dtype): floating-point type of the tables
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: sines and cosines of vertices slopes
+    """
+    slopes = (
+        pi / corners * np.arange(2 * corners) + first_corner_slope
+    ).astype(dtype)
+    sines = np.sin(slopes)
+    cosines = np.cos(slopes)
+    sines.flags.writeable = False
+    cosines.flags.writeable = False
+    return sines, cosines
+
+
+def _build_star(
+    center_x: ArrayLike,
+    center_y: ArrayLike,
+    outer_radius: ArrayLike,
+    inner_radius: ArrayLike,
+    first_corner_slope: ArrayLike,
+    corners: int,
+    decimals: int,
+    dtype: DTypeLike = np.float64
+) -> tuple[np.ndarray, np.ndarray]:
+    """Calculates coordinates of all star vertices in a single vectorized
+    pass over the unit circle tables. Corners and inner vertices are
+    interleaved, the latter placed halfway between the neighbouring corners.
+    Any of the arguments but corners and decimals may be given as an array
+    of M values instead, to build M stars at once.
+
+    Args:
+        center_x (ArrayLike): x-coordinate of the center
+        center_y (ArrayLike): y-coordinate of the center
+        outer_radius (ArrayLike): distance of corners to the center
+        inner_radius (ArrayLike): distance of inner vertices to the center
+        first_corner_slope (ArrayLike): first corner slope in radians
+        corners (int): number of corners
+        decimals (int): number of decimal places
+        dtype (DTypeLike, optional): floating-point type of the calculations
+            and results. Defaults to np.float64.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: x and y-coordinates of vertices, of
+        shape (2 * corners,) or (M, 2 * corners) for M stars
+    """
+    dtype = np.dtype(dtype)
+    if np.ndim(first_corner_slope) == 0:
+        sines, cosines = _unit_circle(
+            corners, float(first_corner_slope), dtype)
+    else:
+        slopes = (
+            pi / corners * np.arange(2 * corners)
+            + np.asarray(first_corner_slope)[:, None]
+        ).astype(dtype)
+        sines = np.sin(slopes)
+        cosines = np.cos(slopes, out=slopes)
+    outer_radius = np.asarray(outer_radius, dtype=dtype)[..., None]
+    inner_radius = np.asarray(inner_radius, dtype=dtype)[..., None]
+    radii = np.empty(
+        np.broadcast(outer_radius, inner_radius).shape[:-1] + (2 * corners,),
+        dtype=dtype)
+    radii[..., 0::2] = outer_radius
+    radii[..., 1::2] = inner_radius
+    center_x = np.asarray(center_x, dtype=dtype)[..., None]
+    center_y = np.asarray(center_y, dtype=dtype)[..., None]
+
+    # Results are calculated in place, with no temporaries of their size
+    shape = np.broadcast_shapes(center_x.shape, sines.shape, radii.shape)
+    xs = np.multiply(sines, radii, out=np.empty(shape, dtype=dtype))
+    xs += center_x
+    np.round(xs, decimals, out=xs)
+    ys = np.multiply(cosines, radii, out=np.empty(shape, dtype=dtype))
+    ys += center_y
+    np.round(ys, decimals, out=ys)
+    return xs, ys
+
+
 class Star:
     """A star.
     """
@@ -149,7 +330,9 @@ class Star:
         corners: int = 5,
         style: int = 2,
         decimals: int = 5,
-        inner_diameter: float = None
+        inner_diameter: float = None,
+        *,
+        validate: bool = True
     ) -> None:
         """Initializes Star object basing on its center point, size given as
         a radius, first corner vertex slope, number of corners and
@@ -170,69 +353,58 @@ class Star:
                 on. Defaults to 2. This parameter counts only if inner diameter 
                 is not specified.
             decimals (int, optional): number of decimal places for floats
-            - see the explanation in Point class constructor.. Defaults to 5.
+            - see the explanation in Point.rounded. Defaults to 5.
             inner_diameter (float, optional): diameter of inner vertices
                 placement. Defaults to None. If provided, style parameter is
                 not taken into consideration.
-        """
+            validate (bool, optional): whether to check the arguments.
+                Defaults to True. Trusted callers may skip it.
 
-        assert corners > 2, "Star should have at least 3 corners"
-        assert (
-            0 <= first_corner_slope < 2 * pi
-        ), "First corner slope should be between 0 and 2π"
+        Raises:
+            ValueError: Exception raised when arguments cannot form a star.
+            StarError: Exception raised when inner vertices cannot be
+                computed for corners and style.
+        """
+        if validate:
+            _check_inputs(corners, first_corner_slope)
 
         self.center = center
         self.outer_diameter = round(outer_diameter, decimals)
         self.first_corner_slope = round(first_corner_slope, decimals)
 
-        # vertices
-        spacing_angle = 2 * pi / corners
-
-        corner_vertices = []
-        outer_radius = self.outer_diameter / 2
-        for i in range(corners):
-            corner_slope = spacing_angle * i + self.first_corner_slope
-            vertex = Point(
-                self.center.x + sin(corner_slope) * outer_radius,
-                self.center.y + cos(corner_slope) * outer_radius
-            )
-            corner_vertices.append(vertex)
-
-        inner_vertices = []
+        # Calculations take the arguments as they are, only the resulting
+        # coordinates are rounded, so that Star.many gives the same ones
+        outer_radius = outer_diameter / 2
         if inner_diameter is None:
-            # Inner vertices paces according to `style`
-            straights = []
-            for i in range(corners):
-                straight = Straight(
-                    corner_vertices[i], corner_vertices[(i + style) % corners])
-                straights.append(straight)
-            for i in range(corners):
-                try:
-                    vertex = straights[i].intersection(
-                        straights[(i - (style-1)) % corners])
-                except CoincidentStraights:
-                    raise StarError(
-                        "Unable to compute inner vertices for corners and style."
-                        " The straights must intersect, but are overlapping.")
-                if not vertex:
-                    raise StarError(
-                        "Unable to compute inner vertices for corners and  style."
-                        " The straights must intersect, but are parallel.")
-                inner_vertices.append(vertex)
+            inner_radius = \
+                outer_radius * _inner_radius_ratio(corners, style)
         else:
-            # Inner vertices placed according to `inner diameter`
-            first_inner_vertex_slope = first_corner_slope + spacing_angle / 2
             inner_radius = inner_diameter / 2
-            for i in range(corners):
-                vertex_slope = first_inner_vertex_slope + i * spacing_angle
-                x = inner_radius * sin(vertex_slope) + center.x
-                y = inner_radius * cos(vertex_slope) + center.y
-                vertex = Point(x, y)
-                inner_vertices.append(vertex)
-
-        self.vertices = list(
-            chain(*zip(corner_vertices, inner_vertices))
+
+        self._xs, self._ys = _build_star(
+            self.center.x,
+            self.center.y,
+            outer_radius,
+            inner_radius,
+            first_corner_slope,
+            corners,
+            decimals
         )
+        self._vertices = None
+
+    @property
+    def vertices(self) -> list[Point]:
+        """All star vertices, corners interleaved with inner vertices. The
+        Point objects are built on first access only.
+
+        Returns:
+            list[Point]: vertices of a star
+        """
+        if self._vertices is None:
+            self._vertices = list(
+                map(Point, self._xs.tolist(), self._ys.tolist())
+            )
+        return self._vertices
 
     def get_x_coordinates(self) -> list[float]:
         """Provides list of x-coordinates of all star vertices, for example
@@ -241,7 +413,7 @@ class Star:
         Returns:
             list[float]: x-coordinates of vertices
         """
-        return [v.x for v in self.vertices]
+        return self._xs.tolist()
 
     def get_y_coordinates(self) -> list[float]:
         """Provides list of y-coordinates of all star vertices, for example
@@ -250,4 +422,83 @@ class Star:
         Returns:
             list[float]: y-coordinates of vertices
         """
-        return [v.y for v in self.vertices]
+        return self._ys.tolist()
+
+    @classmethod
+    def many(
+        cls,
+        centers: ArrayLike,
+        outer_diameters: ArrayLike,
+        first_corner_slopes: ArrayLike = 0,
+        corners: int = 5,
+        style: int = 2,
+        decimals: int = 5,
+        inner_diameters: ArrayLike = None,
+        *,
+        validate: bool = True,
+        dtype: DTypeLike = np.float64
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Calculates coordinates of many stars of the same number of corners
+        at once, much faster than creating Star objects one by one. Each row
+        of the results holds the same coordinates as get_x_coordinates()
+        and get_y_coordinates() of a Star created with the same arguments.
+
+        Args:
+            centers (ArrayLike): (x, y) pairs of stars centers, of shape
+                (M, 2), or a single (x, y) pair
+            outer_diameters (ArrayLike): outer diameter of every star or
+                a single one shared by all stars
+            first_corner_slopes (ArrayLike, optional): first corner slope of
+                every star or a single one shared by all stars. Defaults to 0.
+            corners (int, optional): Number of corners. Defaults to 5.
+            style (int, optional): Style of stars - see Star class
+                constructor. Defaults to 2.
+            decimals (int, optional): number of decimal places for floats
+            - see the explanation in Point.rounded. Defaults to 5.
+            inner_diameters (ArrayLike, optional): diameter of inner vertices
+                placement of every star or a single one shared by all stars.
+                Defaults to None. If provided, style parameter is not taken
+                into consideration.
+            validate (bool, optional): whether to check the arguments, once
+                for all stars. Defaults to True.
+            dtype (DTypeLike, optional): floating-point type of calculations
+                and results. Defaults to np.float64. np.float32 is precise
+                enough for plotting, while using half of the memory.
+
+        Raises:
+            ValueError: Exception raised when arguments cannot form a star
+                or centers are not (x, y) pairs.
+            StarError: Exception raised when inner vertices cannot be
+                computed for corners and style.
+
+        Returns:
+            tuple[np.ndarray, np.ndarray]: x and y-coordinates of vertices,
+            both of shape (M, 2 * corners)
+        """
+        centers = np.asarray(centers, dtype=np.float64)
+        if centers.shape == (2,):
+            centers = centers.reshape(1, 2)
+        elif centers.ndim != 2 or centers.shape[1] != 2:
+            raise ValueError(
+                "Centers should be (x, y) pairs, of shape (2,) or (M, 2)")
+        first_corner_slopes = np.asarray(first_corner_slopes, dtype=np.float64)
+        if validate:
+            _check_inputs(corners, first_corner_slopes)
+
+        outer_radii = np.asarray(outer_diameters, dtype=np.float64) / 2
+        if inner_diameters is None:
+            inner_radii = \
+                outer_radii * _inner_radius_ratio(corners, style)
+        else:
+            inner_radii = np.asarray(inner_diameters, dtype=np.float64) / 2
+
+        return _build_star(
+            centers[:, 0],
+            centers[:, 1],
+            outer_radii,
+            inner_radii,
+            first_corner_slopes,
+            corners,
+            decimals,
+            dtype
+        )
@@ -0,0 +1,147 @@
+import unittest
+from math import cos, pi, sin
+
+import numpy as np
+
+from eightstars.geometry import (CoincidentStraights, Point, Star, StarError,
+                                 Straight)
+
+
+class StraightTest(unittest.TestCase):
+
+    def test_intersection(self):
+        a = Straight(Point(0, 0), Point(1, 1))
+        b = Straight(Point(0, 1), Point(1, 0))
+        vertical = Straight(Point(0.5, 0), Point(0.5, 3))
+        self.assertEqual(a.intersection(b), (0.5, 0.5))
+        self.assertEqual(a.intersection(vertical), (0.5, 0.5))
+        self.assertEqual(vertical.intersection(b), (0.5, 0.5))
+
+    def test_parallel(self):
+        a = Straight(Point(0, 0), Point(1, 1))
+        vertical = Straight(Point(0.5, 0), Point(0.5, 3))
+        self.assertIsNone(a.intersection(Straight(Point(0, 1), Point(1, 2))))
+        self.assertIsNone(
+            vertical.intersection(Straight(Point(1, 0), Point(1, 1))))
+
+    def test_parallel_computed_sides(self):
+        # Opposite sides of a hexagon are parallel, although computed
+        # coordinates of their ends are not exact
+        h = [
+            Point(3 * cos(k * pi / 3) + 7, 3 * sin(k * pi / 3) - 2)
+            for k in range(6)
+        ]
+        for k in range(3):
+            side = Straight(h[k], h[k + 1])
+            opposite = Straight(h[k + 3], h[(k + 4) % 6])
+            self.assertIsNone(side.intersection(opposite))
+
+    def test_parallel_far_from_origin(self):
+        a = Straight(Point(1000.1, 1000.2), Point(1000.3, 1000.5))
+        b = Straight(Point(2000.1, 0.2), Point(2000.3, 0.5))
+        self.assertIsNone(a.intersection(b))
+
+    def test_coincident(self):
+        pairs = [
+            (Point(0, 0), Point(3, 1), Point(6, 2), Point(9, 3)),
+            (Point(0.5, 7), Point(0.5, 9), Point(0.5, 0), Point(0.5, 3)),
+        ]
+        for A, B, C, D in pairs:
+            with self.assertRaises(CoincidentStraights):
+                Straight(A, B).intersection(Straight(C, D))
+
+
+class StarTest(unittest.TestCase):
+
+    def test_default_star(self):
+        star = Star(Point(0, 0), 2)
+        np.testing.assert_allclose(star.get_x_coordinates(), [
+            0, 0.22451, 0.95106, 0.36327, 0.58779,
+            0, -0.58779, -0.36327, -0.95106, -0.22451
+        ], atol=1e-5)
+        np.testing.assert_allclose(star.get_y_coordinates(), [
+            1, 0.30902, 0.30902, -0.11803, -0.80902,
+            -0.38197, -0.80902, -0.11803, 0.30902, 0.30902
+        ], atol=1e-5)
+
+    def test_few_decimals(self):
+        star = Star(Point(0, 0), 100, decimals=0)
+        self.assertEqual(
+            star.get_x_coordinates(),
+            [0, 11, 48, 18, 29, 0, -29, -18, -48, -11]
+        )
+        for corners, style in ((8, 3), (12, 5)):
+            star = Star(Point(0, 0), 100, corners=corners, style=style,
+                        decimals=0)
+            self.assertEqual(len(star.get_x_coordinates()), 2 * corners)
+
+    def test_invalid_arguments(self):
+        for corners, slope in ((2, 0), (5, -0.1), (5, 7)):
+            with self.assertRaises(ValueError):
+                Star(Point(0, 0), 1, slope, corners)
+        with self.assertRaises(ValueError):
+            Star.many([(0, 0), (1, 1)], 1, [0.1, 7])
+
+    def test_overlapping_straights(self):
+        with self.assertRaisesRegex(StarError, "overlapping"):
+            Star(Point(0, 0), 1, style=1)
+
+    def test_parallel_straights(self):
+        with self.assertRaisesRegex(StarError, "parallel"):
+            Star(Point(0, 0), 1, corners=6, style=4)
+
+
+class StarManyTest(unittest.TestCase):
+
+    def assert_rows_equal_stars(self, xs, ys, stars):
+        self.assertEqual(xs.shape, (len(stars), len(stars[0].vertices)))
+        for x, y, star in zip(xs, ys, stars):
+            self.assertEqual(x.tolist(), star.get_x_coordinates())
+            self.assertEqual(y.tolist(), star.get_y_coordinates())
+
+    def test_rows_equal_stars(self):
+        rng = np.random.default_rng(8)
+        centers = rng.uniform(-100, 100, (200, 2))
+        diameters = rng.uniform(0.1, 10, 200)
+        slopes = rng.uniform(0, 6, 200)
+
+        xs, ys = Star.many(centers, diameters, slopes, corners=7, style=3)
+        self.assert_rows_equal_stars(xs, ys, [
+            Star(Point(*c), d, s, corners=7, style=3)
+            for c, d, s in zip(centers, diameters, slopes)
+        ])
+
+        xs, ys = Star.many(centers, 2, inner_diameters=diameters / 10)
+        self.assert_rows_equal_stars(xs, ys, [
+            Star(Point(*c), 2, inner_diameter=d / 10)
+            for c, d in zip(centers, diameters)
+        ])
+
+    def test_halfway_arguments(self):
+        # Built-in round and np.round disagree on such values, so the
+        # arguments must not be rounded before calculations
+        xs, ys = Star.many((0, 0), 4.415335, 0.415335)
+        self.assert_rows_equal_stars(
+            xs, ys, [Star(Point(0, 0), 4.415335, 0.415335)])
+
+    def test_single_center(self):
+        xs, ys = Star.many((1, 2), 3)
+        self.assertEqual(xs.shape, (1, 10))
+        self.assert_rows_equal_stars(xs, ys, [Star(Point(1, 2), 3)])
+
+    def test_float32(self):
+        centers = np.random.default_rng(5).uniform(-100, 100, (50, 2))
+        xs, ys = Star.many(centers, 1, dtype=np.float32)
+        expected_xs, expected_ys = Star.many(centers, 1)
+        self.assertEqual(xs.dtype, np.float32)
+        np.testing.assert_allclose(xs, expected_xs, atol=1e-4)
+        np.testing.assert_allclose(ys, expected_ys, atol=1e-4)
+
+    def test_invalid_centers(self):
+        for centers in (np.zeros((2, 3)), np.zeros(3), np.zeros((2, 2, 2))):
+            with self.assertRaises(ValueError):
+                Star.many(centers, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()